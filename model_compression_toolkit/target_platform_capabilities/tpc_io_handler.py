@@ -54,7 +54,8 @@ def _get_tpc_from_json(tpc_path: str) -> schema.TargetPlatformCapabilities:
         # json_schema = _get_json_schema(tpc_path)
         # tpc = json_schema.TargetPlatformCapabilities.parse_raw(data)
         # return tpc_to_current_schema_version(tpc)
-        tpc = schema.TargetPlatformCapabilities.parse_raw(data)
+        # Parse and validate in a single pass with pydantic-core's native JSON parser.
+        tpc = schema.TargetPlatformCapabilities.model_validate_json(data)
         return tpc_to_current_schema_version(tpc)
     except ValueError as e:
         raise ValueError(f"Invalid JSON for loading TargetPlatformCapabilities in '{tpc_path}': {e}.") from e
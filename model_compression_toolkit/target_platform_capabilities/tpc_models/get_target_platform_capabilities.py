@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import warnings
+from functools import lru_cache
+
 from model_compression_toolkit.constants import TENSORFLOW, PYTORCH
 from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL, IMX500_TP_MODEL, \
     TFLITE_TP_MODEL, QNNPACK_TP_MODEL
@@ -21,6 +24,11 @@ from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tp
 from model_compression_toolkit.target_platform_capabilities.tpc_models.tflite_tpc.v1.tpc import get_tpc as get_tpc_tflite_v1
 from model_compression_toolkit.target_platform_capabilities.tpc_models.qnnpack_tpc.v1.tpc import get_tpc as get_tpc_qnnpack_v1
 
+# Maps a target platform name to the function that builds its (v1) TargetPlatformCapabilities.
+_TPC_GETTERS = {IMX500_TP_MODEL: get_tpc_imx500_v1,
+                TFLITE_TP_MODEL: get_tpc_tflite_v1,
+                QNNPACK_TP_MODEL: get_tpc_qnnpack_v1}
+
 
 # TODO: These methods need to be replaced once modifying the TPC API.
 
@@ -31,6 +39,10 @@ def get_target_platform_capabilities(fw_name: str,
     This is a degenerated function that only returns the MCT default TargetPlatformCapabilities object, to comply with the
     existing TPC API.
 
+    The TargetPlatformCapabilities object does not depend on the framework, so it is built once per
+    (target_platform_name, target_platform_version) and reused on subsequent calls. The returned object is frozen,
+    so it is safe to share between callers.
+
     Args:
         fw_name: Framework name of the FrameworkQuantizationCapabilities.
         target_platform_name: Target platform model name the model will use for inference.
@@ -43,24 +55,39 @@ def get_target_platform_capabilities(fw_name: str,
     assert fw_name in [TENSORFLOW, PYTORCH], f"Unsupported framework {fw_name}."
 
     if target_platform_name == DEFAULT_TP_MODEL:
-        return get_tpc_imx500_v1()
+        return _get_target_platform_capabilities(IMX500_TP_MODEL, 'v1')
 
     assert target_platform_version == 'v1' or target_platform_version is None, \
         "The usage of get_target_platform_capabilities API is supported only with the default TPC ('v1')."
 
-    if target_platform_name == IMX500_TP_MODEL:
-        return get_tpc_imx500_v1()
-    elif target_platform_name == TFLITE_TP_MODEL:
-        return get_tpc_tflite_v1()
-    elif target_platform_name == QNNPACK_TP_MODEL:
-        return get_tpc_qnnpack_v1()
+    return _get_target_platform_capabilities(target_platform_name, 'v1')
+
+
+@lru_cache(maxsize=None)
+def _get_target_platform_capabilities(target_platform_name: str,
+                                      target_platform_version: str) -> TargetPlatformCapabilities:
+    """
+    Build the TargetPlatformCapabilities object for get_target_platform_capabilities. The result is cached.
+
+    Args:
+        target_platform_name: Target platform model name the model will use for inference.
+        target_platform_version: Normalized target platform capabilities version (only 'v1' is supported).
+
+    Returns:
+        A TargetPlatformCapabilities object.
+    """
 
-    raise ValueError(f"Unsupported target platform name {target_platform_name}.")
+    get_tpc = _TPC_GETTERS.get(target_platform_name)
+    if get_tpc is None:
+        raise ValueError(f"Unsupported target platform name {target_platform_name}. "
+                         f"Available target platforms: {[DEFAULT_TP_MODEL] + list(_TPC_GETTERS)}.")
+    return get_tpc()
 
 
 def get_tpc_model(name: str, tpc: TargetPlatformCapabilities):
     """
     This is a utility method that just returns the TargetPlatformCapabilities that it receives, to support existing TPC API.
+    It is deprecated and will be removed in a future release: use the TargetPlatformCapabilities object directly.
 
     Args:
         name: the name of the TargetPlatformCapabilities (not used in this function).
@@ -71,4 +98,6 @@ def get_tpc_model(name: str, tpc: TargetPlatformCapabilities):
 
     """
 
+    warnings.warn("get_tpc_model is deprecated and will be removed in a future release. "
+                  "Use the TargetPlatformCapabilities object directly.", DeprecationWarning, stacklevel=2)
     return tpc
@@ -18,9 +18,9 @@ if FOUND_TF:
     from model_compression_toolkit.target_platform_capabilities.tpc_models.qnnpack_tpc.v1.tpc import get_tpc as \
         get_keras_tpc_latest
     from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
-        get_tpc_model as generate_keras_tpc, get_tpc_model as generate_keras_tpc
+        get_tpc_model as generate_keras_tpc
 if FOUND_TORCH:
     from model_compression_toolkit.target_platform_capabilities.tpc_models.qnnpack_tpc.v1.tpc import get_tpc as \
         get_pytorch_tpc_latest
     from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
-        get_tpc_model as generate_pytorch_tpc, get_tpc_model as generate_pytorch_tpc
+        get_tpc_model as generate_pytorch_tpc
@@ -24,7 +24,6 @@ import tensorflow as tf
 import model_compression_toolkit as mct
 from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
 from model_compression_toolkit.gptq.keras.gptq_loss import multiple_tensors_mse_loss
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.common_tests.helpers.tensors_compare import cosine_similarity
 from tests.keras_tests.tpc_keras import get_16bit_tpc
@@ -36,13 +35,11 @@ QUANTIZATION_CONFIG = mct.core.QuantizationConfig(activation_error_method=mct.co
                                                   weights_error_method=mct.core.QuantizationErrorMethod.MSE,
                                                   relu_bound_to_power_of_2=False, weights_bias_correction=False)
 
-TWO_BIT_QUANTIZATION = generate_keras_tpc(name="two_bit_network_test",
-                                          tpc=generate_test_tpc({'weights_n_bits': 2,
-                                                                           'activation_n_bits': 2}))
+TWO_BIT_QUANTIZATION = generate_test_tpc({'weights_n_bits': 2,
+                                          'activation_n_bits': 2})
 
-EIGHT_BIT_QUANTIZATION = generate_keras_tpc(name="eight_bit_network_test",
-                                            tpc=generate_test_tpc({'weights_n_bits': 8,
-                                                                             'activation_n_bits': 8}))
+EIGHT_BIT_QUANTIZATION = generate_test_tpc({'weights_n_bits': 8,
+                                            'activation_n_bits': 8})
 
 FLOAT_QUANTIZATION = get_16bit_tpc("float_network_test")
 
@@ -23,7 +23,6 @@ else:
 import numpy as np
 
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.keras_tests.exporter_tests.keras_fake_quant.keras_fake_quant_exporter_base_test import \
     KerasFakeQuantExporterBaseTest
 
@@ -36,7 +35,7 @@ class TestNoQuantKerasFQExporter(KerasFakeQuantExporterBaseTest):
     def get_tpc(self):
         tp = generate_test_tpc({'enable_weights_quantization': False,
                                      'enable_activation_quantization': False})
-        return generate_keras_tpc(name="test_no_quant", tpc=tp)
+        return tp
 
     def get_model(self):
         inputs = Input(shape=self.get_input_shape()[0])
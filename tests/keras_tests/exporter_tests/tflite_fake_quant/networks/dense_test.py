@@ -23,7 +23,6 @@ from tests.keras_tests.exporter_tests.tflite_fake_quant.tflite_fake_quant_export
     TFLiteFakeQuantExporterBaseTest
 
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 
 
 class TestDenseReusedTFLiteFQExporter(TFLiteFakeQuantExporterBaseTest):
@@ -33,7 +32,7 @@ class TestDenseReusedTFLiteFQExporter(TFLiteFakeQuantExporterBaseTest):
 
     def get_tpc(self):
         tp = generate_test_tpc({'weights_n_bits': 2})
-        return generate_keras_tpc(name="test_dense_2bit_reused_weight", tpc=tp)
+        return tp
 
     def get_model(self):
         dense = Dense(27)
@@ -16,7 +16,6 @@
 
 from abc import ABC
 
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 import model_compression_toolkit as mct
 import tensorflow as tf
 
@@ -62,7 +61,7 @@ class BaseBatchNormalizationFolding(BaseKerasFeatureNetworkTest, ABC):
                                      'activation_n_bits': 16,
                                      'enable_weights_quantization': False,
                                      'enable_activation_quantization': False})
-        return generate_keras_tpc(name="bn_folding_test", tpc=tp)
+        return tp
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.NOCLIPPING,
@@ -267,7 +266,7 @@ class BNForwardFoldingTest(BaseKerasFeatureNetworkTest):
                                      'activation_n_bits': 16,
                                      'enable_weights_quantization': False,
                                      'enable_activation_quantization': False})
-        return generate_keras_tpc(name="bn_folding_test", tpc=tp)
+        return tp
 
     def compare(self, quantized_model, float_model, input_x=None, quantization_info=None):
         if self.is_dwconv:
@@ -26,7 +26,6 @@ from model_compression_toolkit.constants import TENSORFLOW
 from model_compression_toolkit.target_platform_capabilities.constants import IMX500_TP_MODEL
 from tests.keras_tests.feature_networks_tests.base_keras_feature_test import BaseKerasFeatureNetworkTest
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.tensors_compare import cosine_similarity
 from tests.keras_tests.utils import get_layers_from_model_by_type
 
@@ -45,7 +44,7 @@ class ConvFuncSubstitutionsTest(BaseKerasFeatureNetworkTest):
     def get_tpc(self):
         tp = generate_test_tpc({'enable_weights_quantization': False,
                                      'enable_activation_quantization': False})
-        return generate_keras_tpc(name="test_no_quant", tpc=tp)
+        return tp
 
     def create_networks(self):
         _in = tf.keras.layers.Input(self.input_shape[1:])
@@ -28,7 +28,6 @@ from mct_quantizers.keras.quantizers import ActivationLutPOTInferableQuantizer
 from mct_quantizers.common.constants import THRESHOLD, LUT_VALUES
 from tests.common_tests.helpers.generate_test_tpc import generate_test_attr_configs, generate_test_op_qc, \
     generate_test_tpc
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.keras_tests.feature_networks_tests.base_keras_feature_test import BaseKerasFeatureNetworkTest
 from tests.keras_tests.utils import get_layers_from_model_by_type
 
@@ -61,7 +60,7 @@ class LUTWeightsQuantizerTest(BaseKerasFeatureNetworkTest):
         qmethod = QuantizationMethod.LUT_SYM_QUANTIZER if self.is_symmetric else QuantizationMethod.LUT_POT_QUANTIZER
         tpc = generate_test_tpc({'weights_n_bits': self.weights_n_bits,
                                            'weights_quantization_method': qmethod})
-        return generate_keras_tpc(name='lut_quantizer_test', tpc=tpc)
+        return tpc
 
     def get_debug_config(self):
         return mct.core.DebugConfig(
@@ -106,7 +105,7 @@ class LUTActivationQuantizerTest(BaseKerasFeatureNetworkTest):
     def get_tpc(self):
         tpc = generate_test_tpc({'activation_quantization_method': QuantizationMethod.LUT_POT_QUANTIZER,
                                            'activation_n_bits': self.activation_n_bits})
-        return generate_keras_tpc(name='lut_quantizer_test', tpc=tpc)
+        return tpc
 
     def get_input_shapes(self):
         return [[self.val_batch_size, 16, 16, self.num_conv_channels]]
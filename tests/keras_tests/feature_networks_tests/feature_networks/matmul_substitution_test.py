@@ -21,7 +21,6 @@ if version.parse(tf.__version__) >= version.parse("2.13"):
 else:
     from keras.layers.core import TFOpLambda
 
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 import model_compression_toolkit as mct
 
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
@@ -39,7 +38,7 @@ class MatmulToDenseSubstitutionTest(BaseKerasFeatureNetworkTest):
                                      'activation_n_bits': 16,
                                      'enable_weights_quantization': False,
                                      'enable_activation_quantization': False})
-        return generate_keras_tpc(name="no_quantization", tpc=tp)
+        return tp
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.NOCLIPPING,
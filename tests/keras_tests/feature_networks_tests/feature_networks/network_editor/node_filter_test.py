@@ -24,7 +24,6 @@ from model_compression_toolkit.core.common.network_editors.node_filters import N
 from model_compression_toolkit.core.common.quantization.quantization_params_fn_selection import \
     get_weights_quantization_params_fn, get_activation_quantization_params_fn
 from model_compression_toolkit.core.keras.constants import KERNEL
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.keras_tests.feature_networks_tests.base_keras_feature_test import BaseKerasFeatureNetworkTest
 from tests.keras_tests.utils import get_layers_from_model_by_type
@@ -60,7 +59,7 @@ class ScopeFilterTest(BaseKerasFeatureNetworkTest):
             'weights_quantization_method': QuantizationMethod.POWER_OF_TWO,
             'activation_n_bits': 16,
             'weights_n_bits': 16})
-        return generate_keras_tpc(name="scope_filter_test", tpc=tpc)
+        return tpc
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.MSE, mct.core.QuantizationErrorMethod.MSE,
@@ -142,7 +141,7 @@ class NameFilterTest(BaseKerasFeatureNetworkTest):
             'weights_quantization_method': QuantizationMethod.POWER_OF_TWO,
             'activation_n_bits': 16,
             'weights_n_bits': 16})
-        return generate_keras_tpc(name="name_filter_test", tpc=tpc)
+        return tpc
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.MSE, mct.core.QuantizationErrorMethod.MSE,
@@ -214,7 +213,7 @@ class TypeFilterTest(BaseKerasFeatureNetworkTest):
             'weights_quantization_method': QuantizationMethod.POWER_OF_TWO,
             'activation_n_bits': 16,
             'weights_n_bits': 16})
-        return generate_keras_tpc(name="type_filter_test", tpc=tpc)
+        return tpc
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.MSE, mct.core.QuantizationErrorMethod.MSE,
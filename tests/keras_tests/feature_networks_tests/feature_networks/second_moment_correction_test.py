@@ -40,7 +40,6 @@ from model_compression_toolkit.target_platform_capabilities.constants import DEF
 from model_compression_toolkit.target_platform_capabilities.schema.mct_current_schema import TargetPlatformCapabilities
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2keras import \
     AttachTpcToKeras
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.keras_tests.feature_networks_tests.base_keras_feature_test import BaseKerasFeatureNetworkTest
 from tests.keras_tests.utils import get_layers_from_model_by_type
@@ -69,7 +68,7 @@ class BaseSecondMomentTest(BaseKerasFeatureNetworkTest, ABC):
         tp = generate_test_tpc({'weights_n_bits': 16,
                                      'activation_n_bits': 16,
                                      'weights_quantization_method': QuantizationMethod.SYMMETRIC})
-        return generate_keras_tpc(name="second_moment_correction_test", tpc=tp)
+        return tp
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(weights_second_moment_correction=True)
@@ -316,7 +315,7 @@ class POTSecondMomentTest(BaseSecondMomentTest):
         tp = generate_test_tpc({'weights_n_bits': 16,
                                      'activation_n_bits': 16,
                                      'weights_quantization_method': QuantizationMethod.POWER_OF_TWO})
-        return generate_keras_tpc(name="second_moment_correction_test", tpc=tp)
+        return tp
 
     def create_networks(self):
         inputs = layers.Input(shape=self.get_input_shapes()[0][1:])
@@ -455,7 +454,7 @@ class UniformSecondMomentTest(BaseSecondMomentTest):
         tp = generate_test_tpc({'weights_n_bits': 16,
                                      'activation_n_bits': 16,
                                      'weights_quantization_method': QuantizationMethod.UNIFORM})
-        return generate_keras_tpc(name="second_moment_correction_test", tpc=tp)
+        return tp
 
     def create_networks(self):
         inputs = layers.Input(shape=self.get_input_shapes()[0][1:])
@@ -18,7 +18,6 @@ import tensorflow as tf
 import numpy as np
 
 from mct_quantizers import KerasActivationQuantizationHolder, QuantizationMethod
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.keras_tests.feature_networks_tests.base_keras_feature_test import BaseKerasFeatureNetworkTest
 import model_compression_toolkit as mct
@@ -40,7 +39,7 @@ class SymmetricThresholdSelectionActivationTest(BaseKerasFeatureNetworkTest):
         tpc = generate_test_tpc({
             'activation_quantization_method': QuantizationMethod.SYMMETRIC,
             'activation_n_bits': 8})
-        return generate_keras_tpc(name="symmetric_threshold_test", tpc=tpc)
+        return tpc
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(activation_error_method=self.activation_threshold_method)
@@ -24,7 +24,6 @@ import model_compression_toolkit as mct
 import tensorflow as tf
 
 from model_compression_toolkit.core.keras.constants import KERNEL
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.keras_tests.feature_networks_tests.base_keras_feature_test import BaseKerasFeatureNetworkTest
 import numpy as np
@@ -69,7 +68,7 @@ class KmeansQuantizerTestBase(BaseKerasFeatureNetworkTest):
         tp = generate_test_tpc({'weights_quantization_method': self.quantization_method,
                                      'weights_n_bits': self.weights_n_bits,
                                      'activation_n_bits': 4})
-        return generate_keras_tpc(name="kmean_quantizer_test", tpc=tp)
+        return tp
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.MSE, mct.core.QuantizationErrorMethod.MSE,
@@ -19,7 +19,6 @@ import numpy as np
 
 
 from mct_quantizers import KerasActivationQuantizationHolder, QuantizationMethod
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.keras_tests.feature_networks_tests.base_keras_feature_test import BaseKerasFeatureNetworkTest
 import model_compression_toolkit as mct
@@ -44,7 +43,7 @@ class UniformRangeSelectionActivationTest(BaseKerasFeatureNetworkTest):
         tpc = generate_test_tpc({
             'activation_quantization_method': QuantizationMethod.UNIFORM,
             'activation_n_bits': 8})
-        return generate_keras_tpc(name="uniform_range_test", tpc=tpc)
+        return tpc
 
     def create_networks(self):
         inputs = layers.Input(shape=self.get_input_shapes()[0][1:])
@@ -13,7 +13,6 @@ from model_compression_toolkit.gptq.keras.gptq_keras_implementation import GPTQK
 from model_compression_toolkit.gptq.keras.gptq_training import KerasGPTQTrainer
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2keras import \
     AttachTpcToKeras
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
 
 
@@ -76,7 +75,7 @@ class TestGPTQModelBuilderWithActivationHolder(unittest.TestCase):
                                                            keras_impl,
                                                            DEFAULT_KERAS_INFO,
                                                            representative_dataset,
-                                                           generate_keras_tpc,
+                                                           lambda name, _tp: _tp,
                                                            (1,) + input_shape,
                                                            attach2fw=AttachTpcToKeras(),
                                                            mixed_precision_enabled=False)
@@ -28,7 +28,6 @@ import tensorflow as tf
 from model_compression_toolkit.gptq.common.gptq_config import GPTQHessianScoresConfig
 from model_compression_toolkit.gptq.common.gptq_constants import QUANT_PARAM_LEARNING_STR, MAX_LSB_STR
 from model_compression_toolkit.gptq.keras.gptq_loss import multiple_tensors_mse_loss
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 
 layers = tf.keras.layers
@@ -132,10 +131,10 @@ class TestGetGPTQConfig(unittest.TestCase):
                                                           regularization_factor=0.001)]
 
         pot_tp = generate_test_tpc({'weights_quantization_method': QuantizationMethod.POWER_OF_TWO})
-        self.pot_weights_tpc = generate_keras_tpc(name="gptq_pot_config_test", tpc=pot_tp)
+        self.pot_weights_tpc = pot_tp
 
         symmetric_tp = generate_test_tpc({'weights_quantization_method': QuantizationMethod.SYMMETRIC})
-        self.symmetric_weights_tpc = generate_keras_tpc(name="gptq_symmetric_config_test", tpc=symmetric_tp)
+        self.symmetric_weights_tpc = symmetric_tp
 
     def test_get_keras_gptq_config_pot(self):
         # This call removes the effect of @tf.function decoration and executes the decorated function eagerly, which
@@ -30,7 +30,6 @@ from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_
 from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2keras import \
     AttachTpcToKeras
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
 
 
@@ -112,7 +111,7 @@ class TestHessianInfoCalculatorBase(unittest.TestCase):
                                            keras_impl,
                                            DEFAULT_KERAS_INFO,
                                            _repr_dataset,
-                                           generate_keras_tpc,
+                                           lambda name, _tp: _tp,
                                            attach2fw=AttachTpcToKeras())
         return graph, _repr_dataset, keras_impl
 
@@ -234,7 +233,7 @@ class TestHessianInfoCalculatorWeights(TestHessianInfoCalculatorBase):
                                            keras_impl,
                                            DEFAULT_KERAS_INFO,
                                            _repr_dataset,
-                                           generate_keras_tpc,
+                                           lambda name, _tp: _tp,
                                            attach2fw=AttachTpcToKeras())
 
         sorted_graph_nodes = graph.get_topo_sorted_nodes()
@@ -278,7 +277,7 @@ class TestHessianInfoCalculatorWeights(TestHessianInfoCalculatorBase):
                                            keras_impl,
                                            DEFAULT_KERAS_INFO,
                                            _repr_dataset,
-                                           generate_keras_tpc,
+                                           lambda name, _tp: _tp,
                                            attach2fw=AttachTpcToKeras())
 
         sorted_graph_nodes = graph.get_topo_sorted_nodes()
@@ -412,7 +411,7 @@ class TestHessianInfoCalculatorActivation(TestHessianInfoCalculatorBase):
                                            keras_impl,
                                            DEFAULT_KERAS_INFO,
                                            _repr_dataset,
-                                           generate_keras_tpc,
+                                           lambda name, _tp: _tp,
                                            attach2fw=AttachTpcToKeras())
 
         sorted_graph_nodes = graph.get_topo_sorted_nodes()
@@ -458,7 +457,7 @@ class TestHessianInfoCalculatorActivation(TestHessianInfoCalculatorBase):
                                            keras_impl,
                                            DEFAULT_KERAS_INFO,
                                            _repr_dataset,
-                                           generate_keras_tpc,
+                                           lambda name, _tp: _tp,
                                            attach2fw=AttachTpcToKeras())
 
         sorted_graph_nodes = graph.get_topo_sorted_nodes()
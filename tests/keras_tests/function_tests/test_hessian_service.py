@@ -27,7 +27,6 @@ from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_
 from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2keras import \
     AttachTpcToKeras
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
 
 
@@ -74,7 +73,7 @@ class TestHessianService(unittest.TestCase):
                                                 self.keras_impl,
                                                 DEFAULT_KERAS_INFO,
                                                 get_representative_dataset_fn(),
-                                                generate_keras_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=AttachTpcToKeras())
 
         self.hessian_service = HessianInfoService(graph=self.graph, fw_impl=self.keras_impl)
@@ -165,7 +164,7 @@ class TestHessianService(unittest.TestCase):
                                                 self.keras_impl,
                                                 DEFAULT_KERAS_INFO,
                                                 get_representative_dataset_fn(),
-                                                generate_keras_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=AttachTpcToKeras())
 
         self.hessian_service = HessianInfoService(graph=self.graph, fw_impl=self.keras_impl)
@@ -13,7 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 from mct_quantizers import QuantizationMethod
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
 import unittest
 import numpy as np
@@ -61,7 +60,6 @@ class TestQuantizationConfigurations(unittest.TestCase):
                 'weights_n_bits': 8,
                 'activation_n_bits': 8,
                 'weights_per_channel_threshold': per_channel})
-            tpc = generate_keras_tpc(name="kl_quant_config_weights_test", tpc=tpc)
 
             qc = mct.core.QuantizationConfig(activation_error_method=mct.core.QuantizationErrorMethod.NOCLIPPING,
                                              weights_error_method=error_method, relu_bound_to_power_of_2=False,
@@ -80,7 +78,7 @@ class TestQuantizationConfigurations(unittest.TestCase):
                 'weights_n_bits': 8,
                 'activation_n_bits': 8,
                 'enable_weights_quantization': False})
-            tpc = generate_keras_tpc(name="kl_quant_config_activation_test", tpc=tp)
+            tpc = tp
 
             qc = mct.core.QuantizationConfig(activation_error_method=error_method,
                                              relu_bound_to_power_of_2=relu_bound_to_power_of_2,
@@ -22,7 +22,6 @@ from tensorflow.keras import layers
 
 import model_compression_toolkit as mct
 from mct_quantizers import QuantizationMethod
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 
@@ -71,7 +70,7 @@ class TestQuantizationConfigurations(unittest.TestCase):
                 'weights_n_bits': 8,
                 'activation_n_bits': 16,
                 'weights_per_channel_threshold': per_channel})
-            tpc = generate_keras_tpc(name="quant_config_weights_test", tpc=tp)
+            tpc = tp
 
             qc = mct.core.QuantizationConfig(activation_error_method=mct.core.QuantizationErrorMethod.NOCLIPPING,
                                              weights_error_method=error_method, relu_bound_to_power_of_2=False,
@@ -88,7 +87,7 @@ class TestQuantizationConfigurations(unittest.TestCase):
                 'activation_quantization_method': quantize_method,
                 'weights_n_bits': 16,
                 'activation_n_bits': 8})
-            tpc = generate_keras_tpc(name="quant_config_activation_test", tpc=tp)
+            tpc = tp
 
             qc = mct.core.QuantizationConfig(activation_error_method=error_method,
                                              weights_error_method=mct.core.QuantizationErrorMethod.NOCLIPPING,
@@ -23,7 +23,6 @@ from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_
 from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2keras import \
     AttachTpcToKeras
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
 import model_compression_toolkit.core.common.hessian as hess
 
@@ -84,7 +83,7 @@ class TestSensitivityEvalWithNonSupportedOutputNodes(unittest.TestCase):
                                                            keras_impl,
                                                            DEFAULT_KERAS_INFO,
                                                            representative_dataset,
-                                                           generate_keras_tpc,
+                                                           lambda name, _tp: _tp,
                                                            attach2fw=AttachTpcToKeras(),
                                                            input_shape=(1, 8, 8, 3),
                                                            mixed_precision_enabled=True)
@@ -25,7 +25,6 @@ from model_compression_toolkit.constants import THRESHOLD
 from model_compression_toolkit.core.keras.constants import KERNEL
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2keras import \
     AttachTpcToKeras
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
 from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
@@ -61,7 +60,7 @@ def get_tpc(per_channel):
     tp = generate_test_tpc(edit_params_dict={
         'weights_quantization_method': QuantizationMethod.SYMMETRIC,
         'weights_per_channel_threshold': per_channel})
-    tpc = generate_keras_tpc(name="symmetric_threshold_selection_test", tpc=tp)
+    tpc = tp
 
     return tpc
 
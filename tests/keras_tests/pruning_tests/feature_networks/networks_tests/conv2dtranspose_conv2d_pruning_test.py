@@ -17,7 +17,6 @@
 import tensorflow as tf
 import numpy as np
 import model_compression_toolkit as mct
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.common_tests.pruning.constant_importance_metric import add_const_importance_metric, \
     ConstImportanceMetric
@@ -46,7 +45,7 @@ class Conv2DTransposetoConv2DPruningTest(PruningKerasFeatureTest):
 
     def get_tpc(self):
         tp = generate_test_tpc({'simd_size': self.simd})
-        return generate_keras_tpc(name="simd_test", tpc=tp)
+        return tp
 
     def get_pruning_config(self):
         if self.use_constant_importance_metric:
@@ -31,7 +31,6 @@ import model_compression_toolkit as mct
 
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc, \
     generate_mixed_precision_test_tpc, generate_tpc_with_activation_mp
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 
 
 
@@ -44,36 +43,36 @@ def get_tpc(name, weight_bits=8, activation_bits=8,
                                        'weights_quantization_method': weights_quantization_method,
                                        'activation_quantization_method': activation_quantization_method,
                                        'weights_per_channel_threshold': per_channel})
-    return generate_keras_tpc(name=name, tpc=tpc)
+    return tpc
 
 
 def get_16bit_tpc(name):
     tpc = generate_test_tpc({'weights_n_bits': 16,
                                        'activation_n_bits': 16})
-    return generate_keras_tpc(name=name, tpc=tpc)
+    return tpc
 
 
 def get_16bit_tpc_per_tensor(name):
     tpc = generate_test_tpc({'weights_n_bits': 16,
                                        'activation_n_bits': 16,
                                        "weights_per_channel_threshold": False})
-    return generate_keras_tpc(name=name, tpc=tpc)
+    return tpc
 
 
 def get_quantization_disabled_keras_tpc(name):
     tp = generate_test_tpc({'enable_weights_quantization': False,
                                  'enable_activation_quantization': False})
-    return generate_keras_tpc(name=name, tpc=tp)
+    return tp
 
 
 def get_activation_quantization_disabled_keras_tpc(name):
     tp = generate_test_tpc({'enable_activation_quantization': False})
-    return generate_keras_tpc(name=name, tpc=tp)
+    return tp
 
 
 def get_weights_quantization_disabled_keras_tpc(name):
     tp = generate_test_tpc({'enable_weights_quantization': False})
-    return generate_keras_tpc(name=name, tpc=tp)
+    return tp
 
 
 def get_weights_only_mp_tpc_keras(base_config, default_config, mp_bitwidth_candidates_list, name):
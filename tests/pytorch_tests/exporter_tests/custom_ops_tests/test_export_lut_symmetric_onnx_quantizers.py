@@ -16,8 +16,6 @@
 import numpy as np
 import torch
 from mct_quantizers import QuantizationMethod
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
-    generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.pytorch_tests.exporter_tests.base_pytorch_onnx_export_test import BasePytorchONNXCustomOpsExportTest
 from tests.pytorch_tests.exporter_tests.custom_ops_tests.test_export_pot_onnx_quantizers import OneLayer
@@ -33,7 +31,7 @@ class TestExportONNXWeightLUTSymmetric2BitsQuantizers(BasePytorchONNXCustomOpsEx
                                      'weights_n_bits': 2,
                                      'weights_quantization_method': QuantizationMethod.LUT_SYM_QUANTIZER,
                                      'activation_quantization_method': QuantizationMethod.POWER_OF_TWO})
-        return generate_pytorch_tpc(name="test_conv2d_2bit_fq_weight", tpc=tp)
+        return tp
 
 
     def compare(self, exported_model, wrapped_quantized_model, quantization_info, onnx_op_to_search="WeightsLUTSymmetricQuantizer"):
@@ -65,7 +63,7 @@ class TestExportONNXWeightLUTPOT2BitsQuantizers(TestExportONNXWeightLUTSymmetric
                                      'weights_n_bits': 2,
                                      'weights_quantization_method': QuantizationMethod.LUT_POT_QUANTIZER,
                                      'activation_quantization_method': QuantizationMethod.POWER_OF_TWO})
-        return generate_pytorch_tpc(name="test_conv2d_2bit_fq_weight", tpc=tp)
+        return tp
 
 
     def compare(self, exported_model, wrapped_quantized_model, quantization_info):
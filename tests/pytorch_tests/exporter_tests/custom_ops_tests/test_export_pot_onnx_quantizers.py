@@ -25,8 +25,6 @@ import model_compression_toolkit as mct
 from model_compression_toolkit.verify_packages import FOUND_ONNXRUNTIME, FOUND_ONNX
 from model_compression_toolkit.exporter.model_exporter.pytorch.pytorch_export_facade import DEFAULT_ONNX_OPSET_VERSION
 
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
-    generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.pytorch_tests.exporter_tests.base_pytorch_onnx_export_test import BasePytorchONNXCustomOpsExportTest
 from tests.pytorch_tests.model_tests.feature_models.qat_test import dummy_train
@@ -53,7 +51,7 @@ class TestExportONNXWeightPOT2BitsQuantizers(BasePytorchONNXCustomOpsExportTest)
     def get_tpc(self):
         tp = generate_test_tpc({'activation_n_bits': 2,
                                      'weights_n_bits': 2})
-        return generate_pytorch_tpc(name="test_conv2d_2bit_fq_weight", tpc=tp)
+        return tp
 
     def compare(self, exported_model, wrapped_quantized_model, quantization_info):
         pot_q_nodes = self._get_onnx_node_by_type(exported_model, "ActivationPOTQuantizer")
@@ -26,8 +26,6 @@ from mct_quantizers import QuantizationMethod
 from model_compression_toolkit.verify_packages import FOUND_ONNXRUNTIME, FOUND_ONNX
 from model_compression_toolkit.exporter.model_exporter.pytorch.pytorch_export_facade import DEFAULT_ONNX_OPSET_VERSION
 
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
-    generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.pytorch_tests.exporter_tests.base_pytorch_onnx_export_test import BasePytorchONNXCustomOpsExportTest
 from tests.pytorch_tests.exporter_tests.custom_ops_tests.test_export_pot_onnx_quantizers import OneLayer
@@ -47,7 +45,7 @@ class TestExportONNXWeightSymmetric2BitsQuantizers(BasePytorchONNXCustomOpsExpor
                                      'weights_n_bits': 2,
                                      'weights_quantization_method': QuantizationMethod.SYMMETRIC,
                                      'activation_quantization_method': QuantizationMethod.SYMMETRIC})
-        return generate_pytorch_tpc(name="test_conv2d_2bit_fq_weight", tpc=tp)
+        return tp
 
 
     def compare(self, exported_model, wrapped_quantized_model, quantization_info):
@@ -23,8 +23,6 @@ from torchvision.models.mobilenetv2 import mobilenet_v2
 import model_compression_toolkit as mct
 from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
-    generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.pytorch_tests.model_tests.feature_models.qat_test import dummy_train
 
@@ -39,7 +37,7 @@ class TestExportingQATModelTorchscript(unittest.TestCase):
 
     def get_tpc(self):
         tp = generate_test_tpc({'weights_n_bits': 2})
-        return generate_pytorch_tpc(name="test_conv2d_2bit_fq_weight", tpc=tp)
+        return tp
 
     def get_serialization_format(self):
         return mct.exporter.PytorchExportSerializationFormat.TORCHSCRIPT
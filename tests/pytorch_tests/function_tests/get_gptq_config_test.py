@@ -23,7 +23,6 @@ from model_compression_toolkit.core import CoreConfig, QuantizationConfig, Quant
 from model_compression_toolkit import DefaultDict
 from model_compression_toolkit.gptq.common.gptq_constants import QUANT_PARAM_LEARNING_STR, MAX_LSB_STR
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.pytorch_tests.model_tests.base_pytorch_test import BasePytorchTest
 
 
@@ -88,7 +87,7 @@ class TestGetGPTQConfig(BasePytorchTest):
             gptq_config.gptq_quantizer_params_override = None
 
         tp = generate_test_tpc({'weights_quantization_method': self.quantization_method})
-        symmetric_weights_tpc = generate_pytorch_tpc(name="gptq_config_test", tpc=tp)
+        symmetric_weights_tpc = tp
 
         float_model = TestModel()
 
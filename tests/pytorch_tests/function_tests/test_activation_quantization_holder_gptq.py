@@ -16,7 +16,6 @@ from model_compression_toolkit.gptq.common.gradual_activation_quantization impor
     GradualActivationQuantizerWrapper
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2pytorch import \
     AttachTpcToPytorch
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from model_compression_toolkit.trainable_infrastructure import TrainingMethod
 from model_compression_toolkit.trainable_infrastructure.common.base_trainable_quantizer import VariableGroup
 from model_compression_toolkit.trainable_infrastructure.pytorch.activation_quantizers import \
@@ -150,7 +149,7 @@ class TestGPTQModelBuilderWithActivationHolder(unittest.TestCase):
                                                            pytorch_impl,
                                                            DEFAULT_PYTORCH_INFO,
                                                            representative_dataset,
-                                                           generate_pytorch_tpc,
+                                                           lambda name, _tp: _tp,
                                                            [1] + input_shape,
                                                            mixed_precision_enabled=False,
                                                            qc=qc,
@@ -28,7 +28,6 @@ from model_compression_toolkit.constants import PYTORCH
 from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
 from model_compression_toolkit.exporter import pytorch_export_model
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from model_compression_toolkit import get_target_platform_capabilities
 
@@ -75,12 +74,10 @@ class TestPyTorch2BitONNXExporter(unittest.TestCase):
         onnx.checker.check_model(self.exported_model_onnx)
 
     def get_tpc(self):
-        return generate_pytorch_tpc(name="2_quant_pytorch_test",
-                                    tpc=generate_test_tpc({'weights_n_bits': 2,
-                                                                     'activation_n_bits': 8,
-                                                                     'enable_weights_quantization': True,
-                                                                     'enable_activation_quantization': True
-                                                           }))
+        return generate_test_tpc({'weights_n_bits': 2,
+                                  'activation_n_bits': 8,
+                                  'enable_weights_quantization': True,
+                                  'enable_activation_quantization': True})
 
     def run_mct(self, model):
         core_config = mct.core.CoreConfig()
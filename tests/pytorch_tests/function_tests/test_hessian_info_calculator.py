@@ -24,7 +24,6 @@ from model_compression_toolkit.core.pytorch.default_framework_info import DEFAUL
 from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2pytorch import \
     AttachTpcToPytorch
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
 from tests.pytorch_tests.model_tests.base_pytorch_test import BasePytorchTest
 import model_compression_toolkit.core.common.hessian as hessian_common
@@ -222,7 +221,7 @@ class BaseHessianTraceBasicModelTest(BasePytorchTest):
         model_float = self.model()
         pytorch_impl = PytorchImplementation()
         graph = prepare_graph_with_configs(model_float, PytorchImplementation(), DEFAULT_PYTORCH_INFO,
-                                           self.representative_data_gen, generate_pytorch_tpc,
+                                           self.representative_data_gen, lambda name, _tp: _tp,
                                            attach2fw=AttachTpcToPytorch())
 
         return graph, pytorch_impl
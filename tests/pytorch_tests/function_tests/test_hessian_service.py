@@ -23,7 +23,6 @@ from model_compression_toolkit.core.pytorch.default_framework_info import DEFAUL
 from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
 from model_compression_toolkit.target_platform_capabilities.targetplatform2framework.attach2pytorch import \
     AttachTpcToPytorch
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
 from tests.pytorch_tests.model_tests.base_pytorch_test import BasePytorchTest
 
@@ -116,7 +115,7 @@ class FetchActivationHessianTest(BaseHessianServiceTest):
                                                 self.pytorch_impl,
                                                 DEFAULT_PYTORCH_INFO,
                                                 representative_dataset,
-                                                generate_pytorch_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=self.attach2fw)
         dataloader = data_gen_to_dataloader(representative_dataset, batch_size=1)
         self.request = HessianScoresRequest(mode=HessianMode.ACTIVATION,
@@ -140,7 +139,7 @@ class FetchWeightsHessianTest(BaseHessianServiceTest):
                                                 self.pytorch_impl,
                                                 DEFAULT_PYTORCH_INFO,
                                                 representative_dataset,
-                                                generate_pytorch_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=self.attach2fw)
 
         self.request = HessianScoresRequest(mode=HessianMode.WEIGHTS,
@@ -164,7 +163,7 @@ class FetchHessianNotEnoughSamplesThrowTest(BaseHessianServiceTest):
                                                 self.pytorch_impl,
                                                 DEFAULT_PYTORCH_INFO,
                                                 representative_dataset,
-                                                generate_pytorch_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=self.attach2fw)
         data_loader = data_gen_to_dataloader(representative_dataset, batch_size=2)
         self.request = HessianScoresRequest(mode=HessianMode.ACTIVATION,
@@ -192,7 +191,7 @@ class FetchHessianNotEnoughSamplesSmallBatchThrowTest(BaseHessianServiceTest):
                                                 self.pytorch_impl,
                                                 DEFAULT_PYTORCH_INFO,
                                                 representative_dataset,
-                                                generate_pytorch_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=self.attach2fw)
 
         data_loader = data_gen_to_dataloader(representative_dataset, batch_size=1)
@@ -222,7 +221,7 @@ class FetchComputeBatchLargerThanReprBatchTest(BaseHessianServiceTest):
                                                 self.pytorch_impl,
                                                 DEFAULT_PYTORCH_INFO,
                                                 representative_dataset,
-                                                generate_pytorch_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=self.attach2fw)
 
         data_loader = data_gen_to_dataloader(representative_dataset, batch_size=3)
@@ -249,7 +248,7 @@ class FetchHessianRequiredZeroTest(BaseHessianServiceTest):
                                                 self.pytorch_impl,
                                                 DEFAULT_PYTORCH_INFO,
                                                 representative_dataset,
-                                                generate_pytorch_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=AttachTpcToPytorch())
         data_loader = data_gen_to_dataloader(representative_dataset, batch_size=1)
         self.request = HessianScoresRequest(mode=HessianMode.ACTIVATION,
@@ -273,7 +272,7 @@ class FetchHessianMultipleNodesTest(BaseHessianServiceTest):
                                                 self.pytorch_impl,
                                                 DEFAULT_PYTORCH_INFO,
                                                 representative_dataset,
-                                                generate_pytorch_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=self.attach2fw)
 
         nodes = list(self.graph.get_topo_sorted_nodes())
@@ -298,7 +297,7 @@ class DoubleFetchHessianTest(BaseHessianServiceTest):
                                                 self.pytorch_impl,
                                                 DEFAULT_PYTORCH_INFO,
                                                 representative_dataset,
-                                                generate_pytorch_tpc,
+                                                lambda name, _tp: _tp,
                                                 attach2fw=self.attach2fw)
 
         target_node = list(self.graph.get_topo_sorted_nodes())[0]
@@ -21,7 +21,6 @@ import torch.nn
 
 import model_compression_toolkit as mct
 from mct_quantizers import QuantizationMethod
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 import torch
 
@@ -78,7 +77,7 @@ class TestQuantizationConfigurations(unittest.TestCase):
                 'weights_n_bits': 8,
                 'activation_n_bits': 16,
                 'weights_per_channel_threshold': per_channel})
-            tpc = generate_pytorch_tpc(name="quant_config_weights_test", tpc=tp)
+            tpc = tp
 
             qc = mct.core.QuantizationConfig(activation_error_method=mct.core.QuantizationErrorMethod.NOCLIPPING,
                                              weights_error_method=error_method,
@@ -96,7 +95,7 @@ class TestQuantizationConfigurations(unittest.TestCase):
                 'activation_quantization_method': quantize_method,
                 'weights_n_bits': 16,
                 'activation_n_bits': 8})
-            tpc = generate_pytorch_tpc(name="quant_config_activation_test", tpc=tp)
+            tpc = tp
 
             qc = mct.core.QuantizationConfig(activation_error_method=error_method,
                                              weights_error_method=mct.core.QuantizationErrorMethod.NOCLIPPING,
@@ -25,7 +25,6 @@ from model_compression_toolkit.target_platform_capabilities.targetplatform2frame
     AttachTpcToPytorch
 from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
 from tests.pytorch_tests.model_tests.base_pytorch_test import BasePytorchTest
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 
 
 class argmax_output_model(torch.nn.Module):
@@ -66,7 +65,7 @@ class TestSensitivityEvalWithNonSupportedOutputBase(BasePytorchTest):
                                                            pytorch_impl,
                                                            DEFAULT_PYTORCH_INFO,
                                                            self.representative_data_gen,
-                                                           generate_pytorch_tpc,
+                                                           lambda name, _tp: _tp,
                                                            input_shape=(1, 3, 16, 16),
                                                            mixed_precision_enabled=True,
                                                            attach2fw=AttachTpcToPytorch())
@@ -34,7 +34,6 @@ from torch.nn import Module
 from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.ptq import pytorch_post_training_quantization
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from model_compression_toolkit.core.pytorch.constants import CALL_FUNCTION, OUTPUT, CALL_METHOD, PLACEHOLDER
 from model_compression_toolkit.core.pytorch.reader.node_holders import DummyPlaceHolder
 from model_compression_toolkit.core.pytorch.utils import torch_tensor_to_numpy, to_torch_tensor
@@ -182,11 +181,11 @@ class BasePytorchLayerTest(BaseLayerTest):
             # Disable all features that are enabled by default:
             tp = generate_test_tpc({'enable_weights_quantization': False,
                                          'enable_activation_quantization': False})
-            return generate_pytorch_tpc(name="base_layer_test", tpc=tp)
+            return tp
         elif self.current_mode == LayerTestMode.QUANTIZED_8_BITS:
             tp = generate_test_tpc({'weights_n_bits': 8,
                                          'activation_n_bits': 8})
-            return generate_pytorch_tpc(name="8bit_layer_test", tpc=tp)
+            return tp
         else:
             raise NotImplemented
 
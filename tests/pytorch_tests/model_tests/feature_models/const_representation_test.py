@@ -19,7 +19,6 @@ import model_compression_toolkit as mct
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy, set_model
 from tests.pytorch_tests.model_tests.base_pytorch_feature_test import BasePytorchFeatureNetworkTest
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.tensors_compare import cosine_similarity
 
 
@@ -56,7 +55,7 @@ class ConstRepresentationTest(BasePytorchFeatureNetworkTest):
         tp = generate_test_tpc({'weights_n_bits': 32,
                                      'activation_n_bits': 32,
                                      'enable_activation_quantization': False})
-        return generate_pytorch_tpc(name="linear_collapsing_test", tpc=tp)
+        return tp
 
     def get_quantization_config(self):
         return mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.NOCLIPPING,
@@ -129,7 +128,7 @@ class ConstRepresentationLinearLayerTest(ConstRepresentationTest):
                                      'activation_n_bits': 32,
                                      'enable_weights_quantization': self.enable_weights_quantization,
                                      'enable_activation_quantization': False})
-        return generate_pytorch_tpc(name="linear_collapsing_test", tpc=tp)
+        return tp
 
     def create_networks(self):
         return ConstRepresentationLinearLayerNet(self.func, self.const)
@@ -208,7 +207,7 @@ class ConstRepresentationCodeTest(BasePytorchFeatureNetworkTest):
         tp = generate_test_tpc({'weights_n_bits': 32,
                                      'activation_n_bits': 32,
                                      'enable_activation_quantization': False})
-        return generate_pytorch_tpc(name="linear_collapsing_test", tpc=tp)
+        return tp
 
     def compare(self, quantized_model, float_model, input_x=None, quantization_info=None):
         in_torch_tensor = to_torch_tensor(input_x[0])
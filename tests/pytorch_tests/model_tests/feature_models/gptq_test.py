@@ -26,7 +26,6 @@ from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig,
     GPTQHessianScoresConfig, GradualActivationQuantizationConfig
 from model_compression_toolkit.gptq.common.gptq_constants import QUANT_PARAM_LEARNING_STR, MAX_LSB_STR
 from model_compression_toolkit.gptq.pytorch.gptq_loss import multiple_tensors_mse_loss
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.pytorch_tests.model_tests.base_pytorch_feature_test import BasePytorchFeatureNetworkTest
 from tests.pytorch_tests.utils import extract_model_weights
@@ -88,10 +87,8 @@ class GPTQBaseTest(BasePytorchFeatureNetworkTest):
         return TestModel()
 
     def get_tpc(self):
-        return generate_pytorch_tpc(
-            name="gptq_test",
-            tpc=generate_test_tpc({'weights_n_bits': self.weights_bits,
-                                             'weights_quantization_method': self.weights_quant_method}))
+        return generate_test_tpc({'weights_n_bits': self.weights_bits,
+                                  'weights_quantization_method': self.weights_quant_method})
 
     def gptq_compare(self, ptq_model, gptq_model, input_x=None):
         pass
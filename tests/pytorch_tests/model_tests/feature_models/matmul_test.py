@@ -14,7 +14,6 @@
 # ==============================================================================
 import torch
 from tests.pytorch_tests.model_tests.base_pytorch_test import BasePytorchTest
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 
 """
@@ -58,16 +57,13 @@ class MatMulNetBaseTest(BasePytorchTest):
 
     def get_tpc(self):
         return {
-            'no_quantization': generate_pytorch_tpc(
-                name="no_quant_pytorch_test",
-                tpc=generate_test_tpc(
-                    {
-                        'weights_n_bits': 32,
-                        'activation_n_bits': 32,
-                        'enable_weights_quantization': False,
-                        'enable_activation_quantization': False
-                    }
-                )
+            'no_quantization': generate_test_tpc(
+                {
+                    'weights_n_bits': 32,
+                    'activation_n_bits': 32,
+                    'enable_weights_quantization': False,
+                    'enable_activation_quantization': False
+                }
             )
         }
 
@@ -35,8 +35,7 @@ from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
 from model_compression_toolkit.qat.pytorch.quantizer.base_pytorch_qat_weight_quantizer import \
     BasePytorchQATWeightTrainableQuantizer
 from model_compression_toolkit.core.common.quantization.quantization_config import CustomOpsetLayers
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc, \
-    get_op_quantization_configs
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import get_op_quantization_configs
 from model_compression_toolkit.trainable_infrastructure import TrainingMethod
 from model_compression_toolkit.trainable_infrastructure.common.base_trainable_quantizer import VariableGroup
 from model_compression_toolkit.trainable_infrastructure.pytorch.activation_quantizers.base_activation_quantizer import \
@@ -110,12 +109,10 @@ class QuantizationAwareTrainingTest(BasePytorchFeatureNetworkTest):
         super().__init__(unit_test, input_shape=(3, 4, 4))
 
     def get_tpc(self):
-        return generate_pytorch_tpc(
-            name="qat_test",
-            tpc=generate_test_tpc({'weights_n_bits': self.weight_bits,
-                                             'activation_n_bits': self.activation_bits,
-                                             'weights_quantization_method': self.weights_quantization_method,
-                                             'activation_quantization_method': self.activation_quantization_method}))
+        return generate_test_tpc({'weights_n_bits': self.weight_bits,
+                                  'activation_n_bits': self.activation_bits,
+                                  'weights_quantization_method': self.weights_quantization_method,
+                                  'activation_quantization_method': self.activation_quantization_method})
 
     def create_networks(self):
         return TestModel()
@@ -226,12 +223,10 @@ class QuantizationAwareTrainingQuantizerHolderTest(QuantizationAwareTrainingTest
         super().__init__(unit_test, finalize=finalize)
 
     def get_tpc(self):
-        return generate_pytorch_tpc(
-            name="qat_test",
-            tpc=generate_test_tpc({'weights_n_bits': self.weight_bits,
-                                             'activation_n_bits': self.activation_bits,
-                                             'weights_quantization_method': self.weights_quantization_method,
-                                             'activation_quantization_method': self.activation_quantization_method}))
+        return generate_test_tpc({'weights_n_bits': self.weight_bits,
+                                  'activation_n_bits': self.activation_bits,
+                                  'weights_quantization_method': self.weights_quantization_method,
+                                  'activation_quantization_method': self.activation_quantization_method})
 
     def create_networks(self):
         return TestModel()
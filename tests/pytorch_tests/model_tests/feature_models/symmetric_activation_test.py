@@ -21,7 +21,6 @@ from mct_quantizers import QuantizationMethod
 from model_compression_toolkit.constants import THRESHOLD
 from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.pytorch_tests.model_tests.base_pytorch_test import BasePytorchTest
 
@@ -50,7 +49,7 @@ class SymmetricActivationTest(BasePytorchTest):
             'activation_quantization_method': QuantizationMethod.SYMMETRIC,
             "enable_weights_quantization": False,
             'activation_n_bits': 8})
-        return {'act_8bit': generate_pytorch_tpc(name="symmetric_layer_test", tpc=tp)}
+        return {'act_8bit': tp}
 
     def get_core_configs(self):
         qc = mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.NOCLIPPING,
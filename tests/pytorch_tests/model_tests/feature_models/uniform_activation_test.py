@@ -19,7 +19,6 @@ import torch
 import model_compression_toolkit as mct
 from mct_quantizers import QuantizationMethod
 from model_compression_toolkit.core.common.user_info import UserInformation
-from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.generate_test_tpc import generate_test_tpc
 from tests.pytorch_tests.model_tests.base_pytorch_test import BasePytorchTest
 
@@ -36,7 +35,7 @@ class UniformActivationTest(BasePytorchTest):
         tp = generate_test_tpc({
             'activation_quantization_method': QuantizationMethod.UNIFORM,
             'activation_n_bits': 2})
-        return {'act_2bit': generate_pytorch_tpc(name="uniform_layer_test", tpc=tp)}
+        return {'act_2bit': tp}
 
     def get_core_configs(self):
         qc = mct.core.QuantizationConfig(mct.core.QuantizationErrorMethod.NOCLIPPING,
@@ -0,0 +1,48 @@
+# Copyright 2026 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import pytest
+
+from model_compression_toolkit.constants import PYTORCH, TENSORFLOW
+from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL, IMX500_TP_MODEL, \
+    TFLITE_TP_MODEL, QNNPACK_TP_MODEL
+from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+    get_target_platform_capabilities, get_tpc_model
+
+
+@pytest.mark.parametrize('tp_model', [IMX500_TP_MODEL, TFLITE_TP_MODEL, QNNPACK_TP_MODEL])
+def test_tpc_is_built_once(tp_model):
+    tpc = get_target_platform_capabilities(PYTORCH, tp_model, 'v1')
+    assert get_target_platform_capabilities(PYTORCH, tp_model, 'v1') is tpc
+    assert get_target_platform_capabilities(fw_name=PYTORCH, target_platform_name=tp_model,
+                                            target_platform_version='v1') is tpc
+
+
+def test_tpc_is_shared_across_frameworks_and_versions():
+    imx500_tpc = get_target_platform_capabilities(PYTORCH, IMX500_TP_MODEL)
+    assert get_target_platform_capabilities(TENSORFLOW, IMX500_TP_MODEL) is imx500_tpc
+    assert get_target_platform_capabilities(PYTORCH, IMX500_TP_MODEL, 'v1') is imx500_tpc
+    assert get_target_platform_capabilities(TENSORFLOW, DEFAULT_TP_MODEL) is imx500_tpc
+    assert get_target_platform_capabilities(PYTORCH, TFLITE_TP_MODEL) is not imx500_tpc
+
+
+def test_unsupported_target_platform_name():
+    with pytest.raises(ValueError, match='Unsupported target platform name'):
+        get_target_platform_capabilities(PYTORCH, 'unknown_platform')
+
+
+def test_get_tpc_model_is_deprecated():
+    tpc = get_target_platform_capabilities(PYTORCH, IMX500_TP_MODEL)
+    with pytest.deprecated_call():
+        assert get_tpc_model('name', tpc) is tpc